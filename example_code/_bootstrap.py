@@ -0,0 +1,85 @@
+# Copyright 2014-2019 Brett Slatkin, Pearson Education Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Shared environment setup for the example scripts.
+示例脚本共用的运行环境：把输出写到临时目录，并在退出时统一清理。
+
+Importing this module switches into a temporary directory and registers a
+single shutdown handler that closes files, restores the working directory
+and removes the temporary directory. Python caches the module after the
+first import, so the handler is registered only once per process.
+"""
+
+# Write all output to a temporary directory
+import atexit
+import builtins
+import functools
+import os
+import sys
+import tempfile
+import weakref
+
+TEST_DIR = tempfile.TemporaryDirectory()
+
+# Make sure Windows processes exit cleanly
+OLD_CWD = os.getcwd()
+os.chdir(TEST_DIR.name)
+
+# 用 WeakSet 登记所有通过 open 打开的文件，退出时只需遍历这些文件。
+OPEN_FILES = weakref.WeakSet()
+REAL_OPEN = builtins.open
+
+# functools.wraps 保留 open 的名字和文档，help(open) 仍然显示内置 open 的说明。
+@functools.wraps(REAL_OPEN)
+def open_tracked(*args, **kwargs):
+    handle = REAL_OPEN(*args, **kwargs)
+    OPEN_FILES.add(handle)
+    return handle
+
+builtins.open = open_tracked
+
+def close_open_files():
+    # 每个文件单独关闭：某个文件 close() 出错（比如写缓冲 flush 失败）时，
+    # 其余文件仍要关闭，否则 Windows 上无法删除临时目录。
+    for handle in list(OPEN_FILES):
+        try:
+            handle.close()
+        except Exception:
+            pass
+
+def _shutdown():
+    # 顺序很重要：先关闭文件、离开临时目录，Windows 上才能删除它。
+    # 即使关闭文件时出错，也要恢复工作目录并删除临时目录。
+    try:
+        close_open_files()
+    finally:
+        try:
+            os.chdir(OLD_CWD)
+        finally:
+            TEST_DIR.cleanup()
+
+atexit.register(_shutdown)
+
+def configure_logging():
+    # 配置日志将输出到 stdout 而不是 stderr。
+    # basicConfig 在根日志器已有 handler 时不会重复配置，多个示例调用也只生效一次。
+    # 只有用到日志的示例才会调用这里，其余示例不必导入 logging。
+    import logging
+    logging.basicConfig(stream=sys.stdout, level=logging.INFO)
+
+def print_error(e):
+    # 把捕获到的异常直接写到 stdout，不经过 logging 的 LogRecord 和 handler。
+    # 输出形如 "ERROR: TypeError: ..."，与 configure_logging 之后 logging.error 的格式不同。
+    sys.stdout.write(f"ERROR: {type(e).__name__}: {e}\n")
@@ -14,37 +14,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-# Reproduce book environment
-import random
-random.seed(1234)
-
-import logging
-from pprint import pprint
-from sys import stdout as STDOUT
-
 # Write all output to a temporary directory
-import atexit
-import gc
-import io
-import os
-import tempfile
-import sys
-
-TEST_DIR = tempfile.TemporaryDirectory()
-atexit.register(TEST_DIR.cleanup)
-
-# Make sure Windows processes exit cleanly
-OLD_CWD = os.getcwd()
-atexit.register(lambda: os.chdir(OLD_CWD))
-os.chdir(TEST_DIR.name)
-
-def close_open_files():
-    everything = gc.get_objects()
-    for obj in everything:
-        if isinstance(obj, io.IOBase):
-            obj.close()
-
-atexit.register(close_open_files)
+import _bootstrap
 
 print(f"\n{'第三条: 了解字节串,字符串与unicode区别':*^50}")
 
@@ -119,15 +90,12 @@ print(b'one' + b'two')
 # 字符串的连接：'one' + 'two'，这是普通字符串的连接。输出：onetwo
 print('one' + 'two')
 
-# 配置日志将输出到 stdout 而不是 stderr
-logging.basicConfig(stream=sys.stdout, level=logging.INFO)
-
 # Example 6
 print(f"\n{'Example 6':*^50}")
 try:
     b'one' + 'two'
 except Exception as e:
-    logging.error(f"Error type: {e.__class__.__name__}, Message: {str(e)}")
+    _bootstrap.print_error(e)
 else:
     assert False
 
@@ -137,7 +105,7 @@ print(f"\n{'Example 7':*^50}")
 try:
     'one' + b'two'
 except Exception as e:
-    logging.error(f"Error type: {e.__class__.__name__}, Message: {str(e)}")
+    _bootstrap.print_error(e)
 else:
     assert False
 
@@ -155,7 +123,7 @@ print(f"\n{'Example 9':*^50}")
 try:
     assert 'red' > b'blue'
 except Exception as e:
-    logging.error(f"Error type: {e.__class__.__name__}, Message: {str(e)}")
+    _bootstrap.print_error(e)
 else:
     assert False
 
@@ -165,7 +133,7 @@ print(f"\n{'Example 10':*^50}")
 try:
     assert b'blue' < 'red'
 except Exception as e:
-    logging.error(f"Error type: {e.__class__.__name__}, Message: {str(e)}")
+    _bootstrap.print_error(e)
 else:
     assert False
 
@@ -188,7 +156,7 @@ print(f"\n{'Example 13':*^50}")
 try:
     print(b'red %s' % 'blue')   # 字节串格式化字符串,是失败的
 except Exception as e:
-    logging.error(f"Error type: {e.__class__.__name__}, Message: {str(e)}")
+    _bootstrap.print_error(e)
 else:
     assert False
 
@@ -206,7 +174,7 @@ try:
     with open('data.bin', 'w') as f:
         f.write(b'\xf1\xf2\xf3\xf4\xf5')    # 字节串写入文本文件，在没有文件的情况下会创建文件
 except Exception as e:
-        logging.error(f"Error type: {e.__class__.__name__}, Message: {str(e)}")
+        _bootstrap.print_error(e)
 else:
     assert False
 
@@ -241,7 +209,7 @@ except Exception as e:
         # 重新定义的 open 函数强制将 encoding='utf-8' 添加到所有文件读取操作，因此在读取文件时，
         # Python 尝试将文件中的字节数据用 UTF-8 解码。
         # 由于 b'\xf1\xf2\xf3\xf4\xf5' 不是有效的 UTF-8 编码字节，因此会触发 UnicodeDecodeError。
-        logging.error(f"Error type: {e.__class__.__name__}, Message: {str(e)}")
+        _bootstrap.print_error(e)
 else:
     assert False
 
@@ -267,3 +235,43 @@ print(f"\n{'Example 19':*^50}")
 with open('data.bin', 'r', encoding='cp1252') as f:
     data = f.read()
 assert data == 'ñòóôõ'
+
+
+# Example 20 --- 按类型查表的 to_str / to_bytes
+# 目的：演示另一种写法：用 type() 作为键查字典，直接找到转换函数，省去每次调用时的 isinstance 判断。
+# 解释：
+# bytes.decode 默认使用 UTF-8 解码；str.encode 默认使用 UTF-8 编码。
+# str(s) 和 bytes(b) 对本身类型的对象会原样返回同一个对象。
+# 注意：查表只认精确类型，bytes 或 str 的子类会引发 KeyError；
+# 需要兼容子类时，仍应使用 Example 3/4 中基于 isinstance 的版本。
+print(f"\n{'Example 20':*^50}")
+TO_STR = {bytes: bytes.decode, str: str}
+TO_BYTES = {str: str.encode, bytes: bytes}
+
+def to_str_by_type(bytes_or_str):
+    return TO_STR[type(bytes_or_str)](bytes_or_str)
+
+def to_bytes_by_type(bytes_or_str):
+    return TO_BYTES[type(bytes_or_str)](bytes_or_str)
+
+print(repr(to_str_by_type(b'foo')))
+print(repr(to_bytes_by_type('bar')))
+assert to_str_by_type(b'foo') == to_str(b'foo')
+assert to_bytes_by_type('bar') == to_bytes('bar')
+
+
+# Example 21 --- 先做 NFC 规范化再处理 Unicode 字符串
+# 目的：Example 2 中的 'à' 是字母 a 加上一个组合重音符号，占两个码位。
+# 解释：
+# unicodedata.normalize('NFC', ...) 会把可以合并的组合字符合成一个预组合字符 '\u00e0'，
+# 字符串变短，后续逐字符处理时也少了一个对象。显示效果不变。
+# 输出：['à', ' ', 'p', 'r', 'o', 'p', 'o', 's']
+#       len before NFC: 9, after: 8
+print(f"\n{'Example 21':*^50}")
+import unicodedata
+
+a = 'a\u0300 propos'
+normalized = unicodedata.normalize('NFC', a)
+print(f"{list(normalized)}")
+print(f'len before NFC: {len(a)}, after: {len(normalized)}')
+assert normalized == '\u00e0 propos'
@@ -14,7 +14,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-# Reproduce book environment
 """
 prefer interpreted F-strings over C-style format strings and str.format
 优先使用解释型 F-strings 而不是 C 风格的格式化字符串和 str.format
@@ -24,62 +23,9 @@ prefer interpreted F-strings over C-style format strings and str.format
 # 在 《Effective Python》 的代码示例中，每个 item 的开头部分有一段类似的代码，
 # 这是为了确保每个代码示例在受控、隔离的环境中运行，并生成一致的结果。
 
-# 目的：确保示例代码中任何使用随机数的部分都能够生成一致的随机结果。
-# 解释：通过设置 random.seed(1234)，即使多次运行代码，或者在不同机器上运行，
-# 使用 random 模块生成的随机数序列都会相同。
-# 这在展示和调试代码时特别有用，避免因为随机数的不同导致输出不一致。
-import random
-import sys
-
-random.seed(1234)
-
-# 总述：配置日志输出。
-# 用于控制日志记录。在示例中，有时需要打印调试信息、异常或错误。这确保日志的输出格式和处理方式一致。
-import logging
-# 用于格式化打印复杂数据结构，让输出更加易读。
-from pprint import pprint
-# 这是系统标准输出的别名。在某些情况下，它可能用于重定向日志或输出结果。
-from sys import stdout as STDOUT
-
 # Write all output to a temporary directory
-# 使用临时目录存储文件输出
-import atexit
-import gc
-import io
-import os
-import tempfile
-# 创建一个临时目录，用于存放任何示例代码生成的文件。
-# 这样可以确保每个示例代码运行时，所有文件操作都是在隔离的、
-# 临时的目录中进行，不会污染系统的文件系统或干扰其他文件。
-TEST_DIR = tempfile.TemporaryDirectory()
-# 注册一个钩子函数，当 Python 程序退出时自动删除这个临时目录及其内容，
-# 确保程序运行后不会遗留任何文件或目录。
-atexit.register(TEST_DIR.cleanup)
-
-# Make sure Windows processes exit cleanly
-# 处理 Windows 的进程退出
-OLD_CWD = os.getcwd()                          # 获取当前工作目录
-# 注册一个钩子函数，确保程序退出时恢复原来的工作目录
-# 确保当程序退出时，自动将工作目录切换回原始的工作目录。
-# 这样做是为了避免在程序结束后，当前目录仍然停留在临时目录中，影响后续的操作。
-atexit.register(lambda: os.chdir(OLD_CWD))
-os.chdir(TEST_DIR.name)                        # 将工作目录切换到临时目录
-
-"""
-总述：确保所有打开的文件都能被正确关闭。
-"""
-def close_open_files():
-    everything = gc.get_objects()
-    for obj in everything:
-        if isinstance(obj, io.IOBase):
-            obj.close()
-
-atexit.register(close_open_files)
-
-# 配置日志将输出到 stdout 而不是 stderr
-logging.basicConfig(stream=sys.stdout, level=logging.INFO)
-
-
+# 使用临时目录存储文件输出，退出时由 _bootstrap 统一关闭文件并清理临时目录。
+import _bootstrap
 
 
 # Example 1 --- 二进制和十六进制格式化
@@ -111,8 +57,8 @@ print(f"\n{'Example 3':*^50}")
 try:
     reordered_tuple = '%-10s = %.2f' % (value, key)
 except Exception as e:
-    # ERROR:root:Error type: TypeError, Message: must be real number, not str
-    logging.error(f"Error type: {e.__class__.__name__}, Message: {str(e)}")
+    # ERROR: TypeError: must be real number, not str
+    _bootstrap.print_error(e)
 else:
     assert False
 
@@ -123,8 +69,8 @@ print(f"\n{'Example 4':*^50}")
 try:
     reordered_string = '%.2f = %-10s' % (key, value)
 except Exception as e:
-    # ERROR:root:Error type: TypeError, Message: must be real number, not str
-    logging.error(f"Error type: {e.__class__.__name__}, Message: {str(e)}")
+    # ERROR: TypeError: must be real number, not str
+    _bootstrap.print_error(e)
 else:
     assert False
 
@@ -216,16 +162,19 @@ assert before == after
 # 目的：展示如何在 for 循环中使用字典键值对进行格式化。
 print(f"\n{'Example 11':*^50}")
 for i, (item, count) in enumerate(pantry):
+    # item.title() 和 round(count) 每行只计算一次，两种格式化方式共用。
+    title = item.title()
+    rounded = round(count)
     # 元组格式化
     before = '#%d: %-10s = %d' % (
         i + 1,
-        item.title(),
-        round(count))
+        title,
+        rounded)
     # 字典格式化
     after = '#%(loop)d: %(item)-10s = %(count)d' % {
         'loop': i + 1,
-        'item': item.title(),
-        'count': round(count),
+        'item': title,
+        'count': rounded,
     }
     print(f"before ::: {before}")
     print(f"after  ::: {after}")
@@ -332,15 +281,17 @@ print(formatted)
 # 用的是Example5中的参数pantry。
 print(f"\n{'Example 20':*^50}")
 for i, (item, count) in enumerate(pantry):
+    title = item.title()
+    rounded = round(count)
     old_style = '#%d: %-10s = %d' % (
         i + 1,
-        item.title(),
-        round(count))
+        title,
+        rounded)
     print("old_style ::: {}".format(old_style))
     new_style = '#{}: {:<10s} = {}'.format(
         i + 1,
-        item.title(),
-        round(count))
+        title,
+        rounded)
     print("new_style ::: {}".format(new_style))
     assert old_style == new_style
 
@@ -426,17 +377,19 @@ assert str_args == str_kw == f_string
 print(f"\n{'Example 26':*^50}")
 # 目的：比较旧式、format 和 f-string 的格式化输出是否一致。
 for i, (item, count) in enumerate(pantry):
+    title = item.title()
+    rounded = round(count)
     old_style = '#%d: %-10s = %d' % (
         i + 1,
-        item.title(),
-        round(count))
+        title,
+        rounded)
 
     new_style = '#{}: {:<10s} = {}'.format(
         i + 1,
-        item.title(),
-        round(count))
+        title,
+        rounded)
 
-    f_string = f'#{i+1}: {item.title():<10s} = {round(count)}'
+    f_string = f'#{i+1}: {title:<10s} = {rounded}'
 
     assert old_style == new_style == f_string
 
@@ -14,40 +14,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-# Reproduce book environment
-
 # Write Helper Functions Instead of Complex Expressions
 # 使用辅助函数取代复杂的表达式
 
-import random
-random.seed(1234)
-
-import logging
-from pprint import pprint
-from sys import stdout as STDOUT
-
 # Write all output to a temporary directory
-import atexit
-import gc
-import io
-import os
-import tempfile
-
-TEST_DIR = tempfile.TemporaryDirectory()
-atexit.register(TEST_DIR.cleanup)
-
-# Make sure Windows processes exit cleanly
-OLD_CWD = os.getcwd()
-atexit.register(lambda: os.chdir(OLD_CWD))
-os.chdir(TEST_DIR.name)
-
-def close_open_files():
-    everything = gc.get_objects()
-    for obj in everything:
-        if isinstance(obj, io.IOBase):
-            obj.close()
-
-atexit.register(close_open_files)
+import _bootstrap
 
 
 # Example 1 --- 使用 parse_qs 解析查询字符串
@@ -168,3 +139,52 @@ my_values = parse_qs('red=5&blue=0&green=',
                      keep_blank_values=True)
 green = get_first_int(my_values, 'green')
 print(f'Green:   {green!r}')
+
+
+# Example 9 --- 一次性提取多个整数值
+# 目的： 当需要读取很多键时，用一个便利函数把它们一起取出来。
+# 解释：
+# parse_all_ints 以 defaults 中的键为准，对每个键调用 get_first_int，
+# 复杂的取值逻辑仍然只写在辅助函数里。值为空或键不存在时使用 defaults 中的默认值。
+# 它只是让调用处更简洁，做的查找和判断与逐个调用 get_first_int 完全相同。
+# 结果：{'red': 5, 'green': 0, 'opacity': 0}
+print(f"\n{'Example 9':*^50}")
+def parse_all_ints(values, defaults):
+    return {
+        key: get_first_int(values, key, default)
+        for key, default in defaults.items()
+    }
+
+colors = parse_all_ints(my_values, {'red': 0, 'green': 0, 'opacity': 0})
+print(colors)
+assert colors == {'red': 5, 'green': 0, 'opacity': 0}
+
+
+# Example 10 --- 只需要整数时直接切分查询字符串
+# 目的： 当查询字符串中只有整数字段时，跳过 parse_qs 生成的“字典套列表”。
+# 解释：
+# parse_int_qs 只用 str.split('&') 和 str.partition('=') 扫描一遍字符串，
+# 直接得到 {键: 整数}，不为每个值再包一层列表。值为空时返回 default。
+# 和 parse_qs 一样跳过空的片段（空字符串、结尾多出的 '&'）；同一个键出现多次时，
+# 和 get_first_int 一样只取第一个值。
+# 注意：它不做百分号解码，只适用于键和值都是普通 ASCII 的场景，其他情况仍应使用 parse_qs。
+# 结果：{'red': 5, 'blue': 0, 'green': 0}
+print(f"\n{'Example 10':*^50}")
+def parse_int_qs(query, default=0):
+    result = {}
+    for pair in query.split('&'):
+        if not pair:
+            continue
+        key, _, value = pair.partition('=')
+        if key not in result:
+            result[key] = int(value) if value else default
+    return result
+
+fast_values = parse_int_qs('red=5&blue=0&green=')
+print(fast_values)
+assert fast_values['green'] == get_first_int(my_values, 'green')
+for query in ('', 'red=5&', 'red=1&red=2'):
+    expected = parse_qs(query, keep_blank_values=True)
+    assert parse_int_qs(query) == {
+        key: get_first_int(expected, key) for key in expected
+    }
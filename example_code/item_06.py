@@ -21,39 +21,14 @@ Prefer Multiple Assignment Unpacking Over Indexing
 """
 
 import random
-import sys
-
 random.seed(1234)
 
 import logging
 
 # Write all output to a temporary directory
-import atexit
-import gc
-import io
-import os
-import tempfile
-
-TEST_DIR = tempfile.TemporaryDirectory()
-atexit.register(TEST_DIR.cleanup)
-
-# Make sure Windows processes exit cleanly
-OLD_CWD = os.getcwd()
-atexit.register(lambda: os.chdir(OLD_CWD))
-os.chdir(TEST_DIR.name)
-
+import _bootstrap
 
-def close_open_files():
-    everything = gc.get_objects()
-    for obj in everything:
-        if isinstance(obj, io.IOBase):
-            obj.close()
-
-
-atexit.register(close_open_files)
-
-# 配置日志将输出到 stdout 而不是 stderr
-logging.basicConfig(stream=sys.stdout, level=logging.INFO)
+_bootstrap.configure_logging()
 
 print(f"\nPrefer Multiple Assignment Unpacking Over Indexing")
 print(f"\n把数据结构直接拆分到多个变量中，避免通过下标索引来访问数据结构")
@@ -91,7 +66,8 @@ try:
     pair = ('Chocolate', 'Peanut butter')
     pair[0] = 'Honey'
 except Exception as e:
-    logging.error(f"Error type: {e.__class__.__name__}, Message: {str(e)}")
+    # 把参数交给 logging，由它在确认要输出这条日志后再格式化消息
+    logging.error('Error type: %s, Message: %s', type(e).__name__, e)
 else:
     assert False
 
@@ -127,6 +103,11 @@ print(f'Favorite {type1} is {name1} with {cals1} calories')
 print(f'Favorite {type2} is {name2} with {cals2} calories')
 print(f'Favorite {type3} is {name3} with {cals3} calories')
 
+# 补充：上面的写法要求字典正好有 3 项。项数不固定时，在 for 循环里做同样的嵌套解包，
+# 每次只拆一个 (键, (名称, 热量))，适用于任意大小的字典。
+for kind, (name, cals) in favorite_snacks.items():
+	print(f'Favorite {kind} is {name} with {cals} calories')
+
 
 # Example 6 --- 冒泡排序实现（不使用交换语法）
 # 目的： 演示通过冒泡排序算法对列表进行排序（不使用 Python 的交换语法）。
@@ -152,6 +133,8 @@ print(names)
 # 解释：
 # 使用 a[i-1], a[i] = a[i], a[i-1] 来交换两个元素，简化了交换过程，不需要临时变量。
 # 这样写法更简洁，而且交换效率相同。
+# 注意：冒泡排序是 O(n²) 的，这里只用来演示交换语法。实际代码中应直接调用 list.sort()，
+# 它使用 C 实现的 Timsort，时间复杂度为 O(n log n)，同样是原地排序。
 print(f"\n{'Example 7':*^50}")
 def bubble_sort(a):
 	for _ in range(len(a)):
@@ -160,8 +143,10 @@ def bubble_sort(a):
 				a[i-1], a[i] = a[i], a[i-1]  # Swap
 
 names = ['pretzels', 'carrots', 'arugula', 'bacon']
+expected = sorted(names)
 bubble_sort(names)
 print(names)
+assert names == expected
 
 
 # Example 8 --- 传统方式遍历列表
@@ -29,27 +29,7 @@ from pprint import pprint
 from sys import stdout as STDOUT
 
 # Write all output to a temporary directory
-import atexit
-import gc
-import io
-import os
-import tempfile
-
-TEST_DIR = tempfile.TemporaryDirectory()
-atexit.register(TEST_DIR.cleanup)
-
-# Make sure Windows processes exit cleanly
-OLD_CWD = os.getcwd()
-atexit.register(lambda: os.chdir(OLD_CWD))
-os.chdir(TEST_DIR.name)
-
-def close_open_files():
-    everything = gc.get_objects()
-    for obj in everything:
-        if isinstance(obj, io.IOBase):
-            obj.close()
-
-atexit.register(close_open_files)
+import _bootstrap
 
 
 # Example 1 --- 生成随机的 32 位二进制数
@@ -68,6 +48,12 @@ for i in range(32):
     if randint(0, 1):
         random_bits |= 1 << i
 print(bin(random_bits))
+# 补充：上面的循环是为了演示 range 的用法。如果只是需要 32 个随机位，
+# random.getrandbits(32) 在 C 层一次生成全部位，不必调用 32 次 randint 再逐位拼接。
+from random import getrandbits
+random_bits = getrandbits(32)
+print(bin(random_bits))
+assert random_bits < 1 << 32
 
 
 # Example 2 --- 遍历并打印列表元素
@@ -116,6 +102,11 @@ print(f"\n{'Example 4':*^50}")
 it = enumerate(flavor_list)
 print(next(it))
 print(next(it))
+# 补充：如果只是想一次取出前 k 个 (索引, 元素) 对，可以用 itertools.islice，
+# 它在 C 层循环调用迭代器，不需要写 k 次 next()。
+from itertools import islice
+first, second = islice(enumerate(flavor_list), 2)
+assert (first, second) == ((0, 'vanilla'), (1, 'chocolate'))
 
 
 # Example 5 --- 使用 enumerate 遍历并打印带索引的元素
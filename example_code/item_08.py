@@ -29,27 +29,7 @@ from pprint import pprint
 from sys import stdout as STDOUT
 
 # Write all output to a temporary directory
-import atexit
-import gc
-import io
-import os
-import tempfile
-
-TEST_DIR = tempfile.TemporaryDirectory()
-atexit.register(TEST_DIR.cleanup)
-
-# Make sure Windows processes exit cleanly
-OLD_CWD = os.getcwd()
-atexit.register(lambda: os.chdir(OLD_CWD))
-os.chdir(TEST_DIR.name)
-
-def close_open_files():
-    everything = gc.get_objects()
-    for obj in everything:
-        if isinstance(obj, io.IOBase):
-            obj.close()
-
-atexit.register(close_open_files)
+import _bootstrap
 
 
 # Example 1 --- 生成名字长度的列表
@@ -63,6 +43,10 @@ print(f"\n{'Example 1':*^50}")
 names = ['Cecilia', 'Lise', 'Marie']
 counts = [len(n) for n in names]
 print(counts)
+# 补充：当要调用的是 len 这样的内置函数时，list(map(len, names)) 得到同样的结果，
+# 而且每个元素直接在 C 层调用 len，不需要执行推导式的字节码。
+# 如果需要的是表达式而不是现成的函数，仍然应该使用列表推导式。
+assert list(map(len, names)) == counts
 
 
 # Example 2 --- 通过索引遍历查找最长名字
@@ -117,6 +101,11 @@ for name, count in zip(names, counts):
         longest_name = name
         max_count = count
 assert longest_name == 'Cecilia'
+# 补充：同样的查找可以交给内置的 max() 一次完成，逐个比较在 C 层进行，不需要手写循环和临时变量。
+# key=itemgetter(1) 按长度比较；长度相同时 max() 保留最先出现的那一项，与上面的循环一致。
+from operator import itemgetter
+longest_name, max_count = max(zip(names, counts), key=itemgetter(1))
+assert longest_name == 'Cecilia'
 
 
 # Example 5 --- zip() 遍历时列表长度不一致的情况
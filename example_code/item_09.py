@@ -29,6 +29,7 @@ Understand the Else Block in Loops
 # Example 2 介绍了使用 break 提前退出时，else 代码块不会执行。
 # Example 3 和 4 进一步展示了在空循环或 while False 的情况下，else 块仍然会运行。
 # Example 5 - 7 则深入到如何利用 for-else 逻辑检查两个数是否互质，以及将逻辑封装到函数中。
+# Example 8 给出实际代码中判断互质的做法：使用 math.gcd。
 """
 
 import random
@@ -39,27 +40,7 @@ from pprint import pprint
 from sys import stdout as STDOUT
 
 # Write all output to a temporary directory
-import atexit
-import gc
-import io
-import os
-import tempfile
-
-TEST_DIR = tempfile.TemporaryDirectory()
-atexit.register(TEST_DIR.cleanup)
-
-# Make sure Windows processes exit cleanly
-OLD_CWD = os.getcwd()
-atexit.register(lambda: os.chdir(OLD_CWD))
-os.chdir(TEST_DIR.name)
-
-def close_open_files():
-    everything = gc.get_objects()
-    for obj in everything:
-        if isinstance(obj, io.IOBase):
-            obj.close()
-
-atexit.register(close_open_files)
+import _bootstrap
 
 
 # Example 1 --- for 循环中执行 Else 代码块
@@ -189,4 +170,24 @@ def coprime_alternate(a, b):
 print(f"coprime_alternate(4, 9) ::: {coprime_alternate(4, 9)}")
 print(f"coprime_alternate(3, 6) ::: {coprime_alternate(3, 6)}")
 assert coprime_alternate(4, 9)
-assert not coprime_alternate(3, 6)
\ No newline at end of file
+assert not coprime_alternate(3, 6)
+
+# Example 8 --- 使用 math.gcd 判断互质
+# 目的：演示在实际代码中判断互质的更好方式。
+# 解释：
+# Example 6 和 7 的试除循环要从 2 一直试到 min(a, b)，是 O(min(a, b)) 次 Python 层面的循环，
+# 它们只是用来演示 for/else 的写法。
+# 两个数互质等价于最大公约数为 1，而 math.gcd 由 C 实现，只需要 O(log min(a, b)) 步。
+# 结果：
+# coprime_gcd(4, 9) ::: True
+# coprime_gcd(3, 6) ::: False
+print(f"\n{'Example 8':*^50}")
+import math
+
+def coprime_gcd(a, b):
+    return math.gcd(a, b) == 1
+
+print(f"coprime_gcd(4, 9) ::: {coprime_gcd(4, 9)}")
+print(f"coprime_gcd(3, 6) ::: {coprime_gcd(3, 6)}")
+assert coprime_gcd(4, 9) == coprime(4, 9)
+assert coprime_gcd(3, 6) == coprime(3, 6)
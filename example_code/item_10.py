@@ -32,29 +32,7 @@ from pprint import pprint
 from sys import stdout as STDOUT
 
 # Write all output to a temporary directory
-import atexit
-import gc
-import io
-import os
-import tempfile
-
-# 创建一个临时目录用于存储输出
-TEST_DIR = tempfile.TemporaryDirectory()
-atexit.register(TEST_DIR.cleanup)
-
-# 确保 Windows 进程干净退出
-OLD_CWD = os.getcwd()
-atexit.register(lambda: os.chdir(OLD_CWD))
-os.chdir(TEST_DIR.name)
-
-# 关闭所有打开的文件
-def close_open_files():
-    everything = gc.get_objects()
-    for obj in everything:
-        if isinstance(obj, io.IOBase):
-            obj.close()
-
-atexit.register(close_open_files)
+import _bootstrap
 
 
 # Example 1 --- 创建水果库存字典
@@ -261,19 +239,22 @@ else:
 # Example 12 --- 模拟从多个水果中选择并制作果汁
 # 目的：演示如何从一系列水果中逐个取出并制作果汁。
 # 解释：
-# FRUIT_TO_PICK 是一个列表，包含了多个水果的库存。
-# pick_fruit() 从列表中取出一个字典（表示一种水果及其数量），并在空时返回空列表。
+# FRUIT_TO_PICK 是一个 deque（双端队列），包含了多个水果的库存。
+# pick_fruit() 从队列头部取出一个字典（表示一种水果及其数量），并在空时返回空列表。
+# 用 deque.popleft() 取头部元素是 O(1) 的；而 list.pop(0) 需要把后面的元素整体前移，是 O(n) 的。
 # 结果：将每次制作的果汁添加到 bottles 列表中，最后打印所有制作的果汁。
 print(f"\n{'Example 12':*^50}")
-FRUIT_TO_PICK = [
+from collections import deque
+
+FRUIT_TO_PICK = deque([
     {'apple': 1, 'banana': 3},
     {'lemon': 2, 'lime': 5},
     {'orange': 3, 'melon': 2},
-]
+])
 
 def pick_fruit():
     if FRUIT_TO_PICK:
-        return FRUIT_TO_PICK.pop(0)
+        return FRUIT_TO_PICK.popleft()
     else:
         return []
 
@@ -297,11 +278,11 @@ print(bottles)
 # 使用 while True 创建无限循环，通过在列表为空时调用 break 提前退出循环。
 # 结果：每次从 FRUIT_TO_PICK 中取出一种水果，制作果汁并添加到 bottles 列表中，最后打印结果。
 print(f"\n{'Example 13':*^50}")
-FRUIT_TO_PICK = [
+FRUIT_TO_PICK = deque([
     {'apple': 1, 'banana': 3},
     {'lemon': 2, 'lime': 5},
     {'orange': 3, 'melon': 2},
-]
+])
 
 bottles = []
 while True:                     # Loop
@@ -321,11 +302,11 @@ print(bottles)
 # 使用赋值表达式同时获取 fresh_fruit 并进行判断，避免了在 while 循环中使用 break 提前退出。
 # 结果：简化了无限循环的逻辑，同时保持了同样的功能。
 print(f"\n{'Example 14':*^50}")
-FRUIT_TO_PICK = [
+FRUIT_TO_PICK = deque([
     {'apple': 1, 'banana': 3},
     {'lemon': 2, 'lime': 5},
     {'orange': 3, 'melon': 2},
-]
+])
 
 bottles = []
 while fresh_fruit := pick_fruit():
@@ -333,4 +314,31 @@ while fresh_fruit := pick_fruit():
         batch = make_juice(fruit, count)
         bottles.extend(batch)
 
-print(bottles)
\ No newline at end of file
+print(bottles)
+
+# Example 15 --- 用表格驱动多个水果库存的判断
+# 目的：演示当判断分支越来越多时，如何把 Example 11 的 if/elif 链改写成一张配方表。
+# 解释：
+# RECIPES 中的每一项是 (水果名, 最低库存, 制作函数)，按优先级排列。
+# for 循环依次查询库存，第一个满足条件的配方就制作并 break；全部不满足时执行 else，得到 'Nothing'。
+# 新增一种水果只需要在表中加一行，不用再嵌套一层 elif。
+# 结果：和 Example 11 一样，香蕉足够时先制作奶昔。
+print(f"\n{'Example 15':*^50}")
+fresh_fruit = {
+    'apple': 10,
+    'banana': 8,
+    'lemon': 5,
+}
+
+RECIPES = (
+    ('banana', 2, lambda count: make_smoothies(slice_bananas(count))),
+    ('apple', 4, make_cider),
+    ('lemon', 1, make_lemonade),
+)
+
+for fruit, minimum, make in RECIPES:
+    if (count := fresh_fruit.get(fruit, 0)) >= minimum:
+        to_enjoy = make(count)
+        break
+else:
+    to_enjoy = 'Nothing'
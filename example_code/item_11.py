@@ -25,39 +25,15 @@ Use Slicing to Access List Subsections
 """
 
 import random
-import sys
 
 random.seed(1234)
 
 import logging
-from pprint import pprint
-from sys import stdout as STDOUT
 
 # Write all output to a temporary directory
-import atexit
-import gc
-import io
-import os
-import tempfile
+import _bootstrap
 
-TEST_DIR = tempfile.TemporaryDirectory()
-atexit.register(TEST_DIR.cleanup)
-
-# Make sure Windows processes exit cleanly
-OLD_CWD = os.getcwd()
-atexit.register(lambda: os.chdir(OLD_CWD))
-os.chdir(TEST_DIR.name)
-
-def close_open_files():
-    everything = gc.get_objects()
-    for obj in everything:
-        if isinstance(obj, io.IOBase):
-            obj.close()
-
-atexit.register(close_open_files)
-
-# 配置日志将输出到 stdout 而不是 stderr
-logging.basicConfig(stream=sys.stdout, level=logging.INFO)
+_bootstrap.configure_logging()
 
 
 # Example 1 --- 使用切片提取列表的子部分
@@ -196,6 +172,9 @@ print(f"a[2:3] = {a[2:3]}")
 print(f"\n{'Example 11':*^50}")
 b = a[:]
 assert b == a and b is not a
+# 补充：list.copy() 得到同样的浅拷贝，它直接调用 C 层的复制函数，不需要先创建 slice 对象，意图也更明确。
+c = a.copy()
+assert c == b and c is not a
 
 
 # Example 12 --- 切片赋值影响列表对象，问题的关键这与这种赋值是引用赋值都是浅拷贝赋值
@@ -211,3 +190,21 @@ a[:] = [101, 102, 103]    # 注意不是切片赋值，所以是直接替换，
 assert a is b             # Still the same list object
 print('After a ', a)      # Now has different contents
 print('After b ', b)      # Same list, so same contents as a
+
+
+# Example 13 --- 对数值数组做切片替换
+# 目的：展示当序列里只有整数时，可以用 array.array 代替 list，切片替换的规则完全相同。
+# 解释：
+# array('q', ...) 把整数紧凑地存放在一块连续内存里（每个 8 字节），而不是每个元素一个 int 对象。
+# 用另一个 array 对切片赋值时，替换是整块内存复制，也可以像 Example 9 一样改变长度。
+# 结果：
+# Before  array('q', [1, 2, 3, 4, 5, 6, 7, 8])
+# After   array('q', [1, 2, 99, 22, 14, 8])
+print(f"\n{'Example 13':*^50}")
+from array import array
+
+numbers = array('q', [1, 2, 3, 4, 5, 6, 7, 8])
+print('Before ', numbers)
+numbers[2:7] = array('q', [99, 22, 14])
+print('After  ', numbers)
+assert numbers.tolist() == [1, 2, 99, 22, 14, 8]
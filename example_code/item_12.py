@@ -26,39 +26,15 @@ Avoid Striding and Slicing in a Single Expression
 """
 
 import random
-import sys
 
 random.seed(1234)
 
 import logging
-from pprint import pprint
-from sys import stdout as STDOUT
 
 # Write all output to a temporary directory
-import atexit
-import gc
-import io
-import os
-import tempfile
+import _bootstrap
 
-TEST_DIR = tempfile.TemporaryDirectory()
-atexit.register(TEST_DIR.cleanup)
-
-# Make sure Windows processes exit cleanly
-OLD_CWD = os.getcwd()
-atexit.register(lambda: os.chdir(OLD_CWD))
-os.chdir(TEST_DIR.name)
-
-def close_open_files():
-    everything = gc.get_objects()
-    for obj in everything:
-        if isinstance(obj, io.IOBase):
-            obj.close()
-
-atexit.register(close_open_files)
-
-# 配置日志将输出到 stdout 而不是 stderr
-logging.basicConfig(stream=sys.stdout, level=logging.INFO)
+_bootstrap.configure_logging()
 
 
 # Example 1 --- 使用步长切片提取奇偶项
@@ -83,6 +59,11 @@ print(f"\n{'Example 2':*^50}")
 x = b'mongoose'
 y = x[::-1]
 print(y)
+# 补充：bytearray(x) 本身也会复制一份数据，所以对 bytes 来说这样并不比 x[::-1] 省事。
+# 只有数据本来就放在 bytearray 里时，调用 reverse() 原地反转才能省掉那次复制。
+buffer = bytearray(x)
+buffer.reverse()
+assert buffer == y
 
 
 # Example 3 --- 对字符串使用步长切片
@@ -30,39 +30,15 @@ Prefer Unpacking Over Indexing
 
 
 import random
-import sys
 
 random.seed(1234)
 
 import logging
-from pprint import pprint
-from sys import stdout as STDOUT
 
 # Write all output to a temporary directory
-import atexit
-import gc
-import io
-import os
-import tempfile
+import _bootstrap
 
-TEST_DIR = tempfile.TemporaryDirectory()
-atexit.register(TEST_DIR.cleanup)
-
-# Make sure Windows processes exit cleanly
-OLD_CWD = os.getcwd()
-atexit.register(lambda: os.chdir(OLD_CWD))
-os.chdir(TEST_DIR.name)
-
-def close_open_files():
-    everything = gc.get_objects()
-    for obj in everything:
-        if isinstance(obj, io.IOBase):
-            obj.close()
-
-atexit.register(close_open_files)
-
-# 配置日志将输出到 stdout 而不是 stderr
-logging.basicConfig(stream=sys.stdout, level=logging.INFO)
+_bootstrap.configure_logging()
 
 
 # Example 1 --- 解包操作不足引发异常
@@ -75,7 +51,7 @@ try:
     car_ages = [0, 9, 4, 8, 7, 20, 19, 1, 6, 15]
     car_ages_descending = sorted(car_ages, reverse=True) # 降序排列
     oldest, second_oldest = car_ages_descending
-except Exception as e:
+except ValueError as e:
     logging.error(f"Error type: {e.__class__.__name__}, Message: {str(e)}")
 else:
     assert False
@@ -101,6 +77,11 @@ print(oldest, second_oldest, others)
 print(f"\n{'Example 3':*^50}")
 oldest, second_oldest, *others = car_ages_descending
 print(oldest, second_oldest, others)
+# 补充：如果只需要最老的两辆车、用不到 others，就不必把整个列表排序。
+# heapq.nlargest 只维护一个大小为 2 的堆，返回的两个元素可以直接解包。
+import heapq
+top_oldest, top_second_oldest = heapq.nlargest(2, car_ages)
+assert (top_oldest, top_second_oldest) == (oldest, second_oldest)
 
 
 # Example 4 --- 不同的解包方式
@@ -127,7 +108,7 @@ try:
     # This will not compile
     source = """*others = car_ages_descending"""    # 语法错误：带星号的赋值目标必须在列表或元组中
     eval(source)
-except Exception as e:
+except SyntaxError as e:
     logging.error(f"Error type: {e.__class__.__name__}, Message: {str(e)}")
 else:
     assert False
@@ -143,7 +124,7 @@ try:
     # This will not compile
     source = """first, *middle, *second_middle, last = [1, 2, 3, 4]""" # 是无效的语法，因为解包中只能有一个剩余值变量。
     eval(source)
-except Exception as e:
+except SyntaxError as e:
     logging.error(f"Error type: {e.__class__.__name__}, Message: {str(e)}")
 else:
     assert False
@@ -165,6 +146,14 @@ car_inventory = {
 
 print(f'Best at {loc1} is {best1}, {len(rest1)} others')
 print(f'Best at {loc2} is {best2}, {len(rest2)} others')
+# 补充：上面的写法依赖字典的插入顺序。如果事先知道要取哪些键，可以用 itemgetter 一次按键取出对应的值，
+# 不需要遍历 items()，结果也不受字典顺序影响。
+from operator import itemgetter
+downtown, airport = itemgetter('Downtown', 'Airport')(car_inventory)
+best_downtown, *rest_downtown = downtown
+best_airport, *rest_airport = airport
+assert (best_downtown, rest_downtown) == (best1, rest1)
+assert (best_airport, rest_airport) == (best2, rest2)
 
 
 # Example 8 --- 处理解包不足的情况
@@ -179,25 +168,25 @@ first, second, *rest = short_list
 print(first, second, rest)
 
 
-# Example 9 --- 迭代器无法自动解包
+# Example 9 --- 对迭代器进行解包
 
 # 迭代器的工作机制：
 # 迭代器（iterator）是一个能够逐个返回元素的对象，但它的元素只会被一次性返回，
 # 当元素被取出后，迭代器的“游标”会向前滑动，指向下一个元素。
 # 不可重复访问：迭代器只能一次性遍历，元素一旦被取出，就不能再回头访问它们了。
 
-# 为什么迭代器无法自动解包？
-# 解包需要一次性获取多个元素，而迭代器的游标只能前进，并且只能逐个获取元素。
-# 如果用迭代器进行解包，Python 会依次获取元素，但由于解包的变量数量是固定的，迭代器的逐步取值特性可能会导致解包不完整，或无法满足所有变量的解包需求。
-# 目的：展示迭代器无法直接通过解包操作获取多个元素。
+# 迭代器能否解包？
+# 可以。解包时 Python 会从迭代器中逐个取出元素，依次赋给左边的变量。
+# 但解包的变量数量是固定的，迭代器中的元素个数必须与之相同：元素不够或取完后还有剩余，都会引发 ValueError。
+# 目的：展示迭代器也可以直接通过解包操作获取多个元素。
 # 解释：
-# iter(range(1, 3)) 是一个迭代器，不能像列表那样直接解包多个值。
-# 结果：引发 TypeError 异常。
+# iter(range(1, 3)) 是一个迭代器，可以像列表那样解包；不同的是它只能遍历一次，解包后就被耗尽。
+# 结果：range(1, 3) 恰好有两个元素，解包成功；元素个数不符时才会引发 ValueError。
 print(f"\n{'Example 9':*^50}")
 it = iter(range(1, 3))
 try:
     first, second = it
-except Exception as e:
+except ValueError as e:
     logging.error(f"Error type: {e.__class__.__name__}, Message: {str(e)}")
 
 
@@ -218,6 +207,7 @@ def generate_csv():
 # 目的：展示如何将生成器的结果转换为列表，并通过解包提取标题和数据。
 # 解释：
 # all_csv_rows 列表存储生成器生成的所有行，header 保存标题行，rows 保存剩余数据。
+# 注意：list() 会把所有行一次性读入内存，只有在之后需要按下标随机访问 rows 时才值得这样做。
 # 结果：输出 CSV 的标题和数据行数。
 print(f"\n{'Example 11':*^50}")
 all_csv_rows = list(generate_csv())
@@ -237,3 +227,19 @@ it = generate_csv()                 # 生成器，逐行生成 CSV 数据
 header, *rows = it
 print('CSV Header:', header)
 print('Row count: ', len(rows))
+
+
+# Example 13 --- 只取标题，其余行按流式处理
+# 目的：演示当数据行只需逐行处理时，如何避免把整个生成器读入列表。
+# 解释：
+# Example 11 和 12 都会把 200 行数据全部存进列表。
+# next(it) 只取出标题行，剩下的行仍留在生成器里，需要时再逐行读取，内存占用与数据行数无关。
+# 这里逐行计数，代替 len(rows)。
+# 结果：输出与 Example 12 相同的标题和数据行数。
+print(f"\n{'Example 13':*^50}")
+it = generate_csv()
+header = next(it)
+row_count = sum(1 for _ in it)
+print('CSV Header:', header)
+print('Row count: ', row_count)
+assert row_count == len(rows)
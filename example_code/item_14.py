@@ -26,39 +26,15 @@ Sort by Complex Criteria Using the key Parameter
 """
 
 import random
-import sys
 
 random.seed(1234)
 
 import logging
-from pprint import pprint
-from sys import stdout as STDOUT
 
 # Write all output to a temporary directory
-import atexit
-import gc
-import io
-import os
-import tempfile
+import _bootstrap
 
-TEST_DIR = tempfile.TemporaryDirectory()
-atexit.register(TEST_DIR.cleanup)
-
-# Make sure Windows processes exit cleanly
-OLD_CWD = os.getcwd()
-atexit.register(lambda: os.chdir(OLD_CWD))
-os.chdir(TEST_DIR.name)
-
-def close_open_files():
-    everything = gc.get_objects()
-    for obj in everything:
-        if isinstance(obj, io.IOBase):
-            obj.close()
-
-atexit.register(close_open_files)
-
-# 配置日志将输出到 stdout 而不是 stderr
-logging.basicConfig(stream=sys.stdout, level=logging.INFO)
+_bootstrap.configure_logging()
 
 
 # Example 1 --- 简单数字排序
@@ -76,9 +52,12 @@ print(numbers)
 # 目的：展示如何定义一个类，并创建该类的实例列表。
 # 解释：
 # Tool 类包含 name 和 weight 属性，__repr__ 方法用于打印对象的详细信息。
+# __slots__ 声明实例只有这两个属性，实例不再各自带一个 __dict__，占用内存更小，属性访问也更快。
 # 结果：创建工具对象，并将其存入列表。
 print(f"\n{'Example 2':*^50}")
 class Tool:
+    __slots__ = ('name', 'weight')
+
     def __init__(self, name, weight):
         self.name = name
         self.weight = weight
@@ -244,6 +223,9 @@ power_tools.sort(key=lambda x: x.weight, # Weight descending
                  reverse=True)
 
 print(power_tools)
+# 补充：重量是数字，可以取负数，所以这两次排序可以合并成 Example 12 那样的一次排序，
+# 只做一轮比较，结果完全相同。多次调用 sort 的写法适合用在无法取负的键上，比如 Example 13 的字符串。
+assert power_tools == sorted(power_tools, key=lambda x: (-x.weight, x.name))
 
 
 # Example 15 --- 按名称排序
@@ -265,3 +247,25 @@ print(f"\n{'Example 16':*^50}")
 power_tools.sort(key=lambda x: x.weight,
                  reverse=True)
 print(power_tools)
+
+
+# Example 17 --- 用 operator.attrgetter 代替 lambda 作为 key
+# 目的：展示只需按属性取值时，可以用 attrgetter 生成 key 函数。
+# 解释：
+# attrgetter('name') 相当于 lambda x: x.name；attrgetter('weight', 'name') 一次返回 (x.weight, x.name) 元组。
+# 它们由 C 实现，排序时每个元素调用 key 不会进入 Python 函数帧；创建一次后可以在多次排序中复用。
+# 需要对属性做计算时（比如 Example 12 的 -x.weight），仍然要用 lambda。
+# 结果：与 Example 10 和 Example 15 的排序结果一致。
+print(f"\n{'Example 17':*^50}")
+from operator import attrgetter
+
+by_name = attrgetter('name')
+by_weight_name = attrgetter('weight', 'name')
+
+power_tools.sort(key=by_weight_name)
+print(power_tools)
+assert power_tools == sorted(power_tools, key=lambda x: (x.weight, x.name))
+
+power_tools.sort(key=by_name)
+print(power_tools)
+assert power_tools == sorted(power_tools, key=lambda x: x.name)
@@ -160,29 +160,34 @@ print(winner)
 # 目的：展示如何通过继承 MutableMapping 实现一个支持排序的字典类。
 # 解释：
 # SortedDict 继承自 MutableMapping，实现了常见的字典操作，并按键进行排序。
+# sorted_keys 在插入和删除时用 bisect 维持有序，遍历时不必每次重新排序；
+# 遍历的是 sorted_keys 的副本，所以遍历过程中删除键也不会漏掉其他键。
 # 结果：可以像普通字典一样使用 SortedDict，并支持按键排序。
 print(f"\n{'Example 13':*^50}")
+from bisect import bisect_left, insort
 from collections.abc import MutableMapping
 
 
 class SortedDict(MutableMapping):
     def __init__(self):
         self.data = {}
+        self.sorted_keys = []
 
     def __getitem__(self, key):
         return self.data[key]
 
     def __setitem__(self, key, value):
+        if key not in self.data:
+            insort(self.sorted_keys, key)
         self.data[key] = value
 
     def __delitem__(self, key):
         del self.data[key]
+        del self.sorted_keys[bisect_left(self.sorted_keys, key)]
 
     def __iter__(self):
-        keys = list(self.data.keys())
-        keys.sort()
-        for key in keys:
-            yield key
+        return iter(list(self.sorted_keys))
+
     def __len__(self):
         return len(self.data)
 
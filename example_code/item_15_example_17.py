@@ -31,26 +31,28 @@ def populate_ranks(votes: Dict[str, int],
 def get_winner(ranks: Dict[str, int]) -> str:
     return next(iter(ranks))
 
-from typing import Iterator, MutableMapping
+from bisect import bisect_left, insort
+from typing import Iterator, List, MutableMapping
 
 class SortedDict(MutableMapping[str, int]):
     def __init__(self) -> None:
         self.data: Dict[str, int] = {}
+        self.sorted_keys: List[str] = []
 
     def __getitem__(self, key: str) -> int:
         return self.data[key]
 
     def __setitem__(self, key: str, value: int) -> None:
+        if key not in self.data:
+            insort(self.sorted_keys, key)
         self.data[key] = value
 
     def __delitem__(self, key: str) -> None:
         del self.data[key]
+        del self.sorted_keys[bisect_left(self.sorted_keys, key)]
 
     def __iter__(self) -> Iterator[str]:
-        keys = list(self.data.keys())
-        keys.sort()
-        for key in keys:
-            yield key
+        return iter(list(self.sorted_keys))
 
     def __len__(self) -> int:
         return len(self.data)
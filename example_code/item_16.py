@@ -265,3 +265,11 @@ count = counters.setdefault(key, 0)
 counters[key] = count + 1
 
 print(counters)
+# 补充：如果字典只用来计数，collections.Counter 更直接。缺失的键默认为 0，
+# update 还可以一次统计一批元素，计数循环在 C 代码里完成。
+from collections import Counter
+bread_counter = Counter(counters)
+bread_counter.update(['wheat', 'brioche', 'focaccia'])
+assert bread_counter['wheat'] == counters['wheat'] + 1
+assert bread_counter['focaccia'] == 1
+print(bread_counter.most_common(2))
@@ -117,6 +117,8 @@ print(visits.data)
 # 目的：展示如何通过 defaultdict 简化缺失键的处理。
 # 解释：
 # defaultdict(set) 自动为不存在的键创建一个空集合，简化了添加城市的操作。
+# Example 3 的 setdefault(country, set()) 每次调用都会先创建一个 set()，键已存在时这个集合立即被丢弃；
+# defaultdict 只在键缺失时才调用 set()。
 # 结果：输出更新后的访问记录。
 print(f"\n{'Example 5':*^50}")
 from collections import defaultdict
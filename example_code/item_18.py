@@ -227,3 +227,29 @@ handle.seek(0)
 image_data = handle.read()
 print(pictures)
 print(image_data)
+# 补充：Pictures 会一直持有打开的文件，路径很多时可能耗尽文件描述符。
+# 可以限制缓存大小：字典保持插入顺序，超出上限时关闭并移除最早打开的文件。
+class BoundedPictures(Pictures):
+    def __init__(self, max_size):
+        if max_size < 1:
+            raise ValueError('max_size must be at least 1')
+        super().__init__()
+        self.max_size = max_size
+
+    def __missing__(self, key):
+        if len(self) >= self.max_size:
+            oldest = next(iter(self))
+            self.pop(oldest).close()
+        return super().__missing__(key)
+
+
+other_path = 'account_9091.csv'
+
+with open(other_path, 'wb') as f:
+    f.write(b'image data here 9091')
+
+bounded = BoundedPictures(max_size=1)
+first_handle = bounded[path]
+bounded[other_path]
+assert list(bounded) == [other_path]
+assert first_handle.closed
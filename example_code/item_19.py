@@ -119,12 +119,16 @@ print(f'Shortest: {shortest:>4.0%}')
 # 结果：输出所有统计数据，并验证其正确性。
 print(f"\n{'Example 4':*^50}")
 def get_stats(numbers):
-    minimum = min(numbers)
-    maximum = max(numbers)
+    # 排序后的首尾元素就是最小值和最大值，不必再用 min 和 max 各遍历一遍。
+    # 空序列没有首尾元素，和 min() 一样抛出 ValueError。
+    if not numbers:
+        raise ValueError('get_stats() arg is an empty sequence')
+    sorted_numbers = sorted(numbers)
+    minimum = sorted_numbers[0]
+    maximum = sorted_numbers[-1]
     count = len(numbers)
     average = sum(numbers) / count
 
-    sorted_numbers = sorted(numbers)
     middle = count // 2
     if count % 2 == 0:
         lower = sorted_numbers[middle - 1]
@@ -158,12 +162,14 @@ from collections import namedtuple
 Stats = namedtuple('Stats', ['minimum', 'maximum', 'average', 'median', 'count'])
 
 def get_stats(numbers):
-    minimum = min(numbers)
-    maximum = max(numbers)
+    if not numbers:
+        raise ValueError('get_stats() arg is an empty sequence')
+    sorted_numbers = sorted(numbers)
+    minimum = sorted_numbers[0]
+    maximum = sorted_numbers[-1]
     count = len(numbers)
     average = sum(numbers) / count
 
-    sorted_numbers = sorted(numbers)
     middle = count // 2
     if count % 2 == 0:
         lower = sorted_numbers[middle - 1]
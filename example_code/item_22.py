@@ -65,7 +65,7 @@ def log(message, values):
     if not values:
         print(message)
     else:
-        values_str = ', '.join(str(x) for x in values)
+        values_str = ', '.join([str(x) for x in values])
         print(f'{message}: {values_str}')
 
 log('My numbers are', [1, 2])
@@ -82,7 +82,7 @@ def log(message, *values):  # The only difference
     if not values:
         print(message)
     else:
-        values_str = ', '.join(str(x) for x in values)
+        values_str = ', '.join([str(x) for x in values])
         print(f'{message}: {values_str}')
 
 log('My numbers are', 1, 2)
@@ -126,7 +126,7 @@ def log(sequence, message, *values):
     if not values:
         print(f'{sequence} - {message}')
     else:
-        values_str = ', '.join(str(x) for x in values)
+        values_str = ', '.join([str(x) for x in values])
         print(f'{sequence} - {message}: {values_str}')
 
 log(1, 'Favorites', 7, 33)      # New with *args OK